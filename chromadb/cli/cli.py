@@ -1,19 +1,27 @@
+from enum import Enum
 from typing import Optional
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 import typer.rich_utils
 from typing_extensions import Annotated
 import typer
-import uvicorn
 import os
+import sys
 import webbrowser
 
-from chromadb.cli.utils import get_directory_size, set_log_file_path, sizeof_fmt
-from chromadb.config import Settings, System
-from chromadb.db.impl.sqlite import SqliteDB
-from chromadb.ingest.impl.utils import trigger_vector_segments_max_seq_id_migration
-from chromadb.segment import SegmentManager
+from chromadb.cli.utils import (
+    get_directory_size,
+    get_file_size,
+    set_log_file_path,
+    sizeof_fmt,
+)
+
+
+class EventLoop(str, Enum):
+    auto = "auto"
+    asyncio = "asyncio"
+    uvloop = "uvloop"
+
 
 app = typer.Typer()
 utils_app = typer.Typer(short_help="Use maintenance utilities")
@@ -34,6 +42,9 @@ _logo = """
 
     """
 
+# Bold logo followed by a bold "Running Chroma", assembled once so it is written in one call
+_banner = f"\033[1m\n{_logo}\n\033[1m\nRunning Chroma\n\033[0m\n"
+
 
 @app.command()  # type: ignore
 def run(
@@ -47,16 +58,21 @@ def run(
         Optional[str], typer.Option(help="The path to the log file.")
     ] = "chroma.log",
     port: int = typer.Option(8000, help="The port to run the server on."),
+    loop: EventLoop = typer.Option(
+        EventLoop.auto,
+        help="The event loop implementation to use. auto uses uvloop when it is available.",
+    ),
     test: bool = typer.Option(False, help="Test mode.", show_envvar=False, hidden=True),
 ) -> None:
     """Run a chroma server"""
     console = Console()
 
-    print("\033[1m")  # Bold logo
-    print(_logo)
-    print("\033[1m")  # Bold
-    print("Running Chroma")
-    print("\033[0m")  # Reset
+    # Skip the colored logo when output is piped, e.g. to docker or systemd logs
+    if sys.stdout.isatty():
+        sys.stdout.write(_banner)
+        sys.stdout.flush()
+    else:
+        print("Running Chroma\n")
 
     console.print(f"[bold]Saving data to:[/bold] [green]{path}[/green]")
     console.print(
@@ -85,11 +101,15 @@ def run(
         "workers": 1,
         "log_config": log_config,  # Pass the modified log_config dictionary
         "timeout_keep_alive": 30,
+        "loop": loop.value,
     }
 
     if test:
         return
 
+    # Imported here so that other subcommands don't pay for loading the server stack
+    import uvicorn
+
     uvicorn.run(**config)
 
 
@@ -99,6 +119,10 @@ def vacuum(
         help="The path to a Chroma data directory.",
     ),
     force: bool = typer.Option(False, help="Force vacuuming without confirmation."),
+    checkpoint_only: bool = typer.Option(
+        False,
+        help="Only checkpoint and truncate the write-ahead log. This is much faster than a full vacuum and does not require confirmation.",
+    ),
 ) -> None:
     """
     Vacuum the database. This may result in a small increase in performance.
@@ -106,7 +130,18 @@ def vacuum(
     If you recently upgraded Chroma from a version below 0.6 to 0.6 or above, you should run this command once to greatly reduce the size of your database and enable continuous database pruning. In most other cases, vacuuming will save very little disk space.
 
     The execution time of this command scales with the size of your database. It block both reads and writes to the database while it is running.
+
+    To only reclaim the space used by the write-ahead log, pass --checkpoint-only. This is fast and can be run routinely.
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from chromadb.config import Settings, System
+    from chromadb.db.impl.sqlite import SqliteDB
+    from chromadb.ingest.impl.utils import (
+        trigger_vector_segments_max_seq_id_migration,
+    )
+    from chromadb.segment import SegmentManager
+
     console = Console(
         highlight=False
     )  # by default, rich highlights numbers which makes the output look weird when we try to color numbers ourselves
@@ -121,18 +156,32 @@ def vacuum(
         )
         raise typer.Exit(code=1)
 
-    if not force and not typer.confirm(
-        "Are you sure you want to vacuum the database? This will block both reads and writes to the database and may take a while. We recommend shutting down the server before running this command. Continue?",
-    ):
-        console.print("Vacuum cancelled.")
-        raise typer.Exit(code=0)
-
     settings = Settings()
     settings.is_persistent = True
     settings.persist_directory = path
     system = System(settings=settings)
     sqlite = system.instance(SqliteDB)
 
+    if checkpoint_only:
+        wal_path = f"{path}/chroma.sqlite3-wal"
+        wal_size_before_checkpoint = get_file_size(wal_path)
+        try:
+            sqlite.checkpoint()
+        except Exception as e:
+            console.print(f"[bold red]Error checkpointing database:[/bold red] {e}")
+            raise typer.Exit(code=1)
+        size_diff = wal_size_before_checkpoint - get_file_size(wal_path)
+        console.print(
+            f":soap: [bold]checkpoint complete![/bold] Write-ahead log reduced by [green]{sizeof_fmt(size_diff)}[/green]."
+        )
+        return
+
+    if not force and not typer.confirm(
+        "Are you sure you want to vacuum the database? This will block both reads and writes to the database and may take a while. We recommend shutting down the server before running this command. Continue?",
+    ):
+        console.print("Vacuum cancelled.")
+        raise typer.Exit(code=0)
+
     directory_size_before_vacuum = get_directory_size(path)
 
     console.print()  # Add a newline before the progress bar
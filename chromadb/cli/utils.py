@@ -30,6 +30,14 @@ def get_directory_size(directory: str) -> int:
     return total
 
 
+def get_file_size(path: str) -> int:
+    """Get the size of a file in bytes, or 0 if it does not exist"""
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
 # https://stackoverflow.com/a/1094933
 def sizeof_fmt(num: int, suffix: str = "B") -> str:
     n: float = float(num)
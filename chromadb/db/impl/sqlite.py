@@ -37,7 +37,6 @@ class TxWrapper(base.TxWrapper):
     @override
     def __enter__(self) -> base.Cursor:
         if len(self._tx_stack.stack) == 0:
-            self._conn.execute("PRAGMA case_sensitive_like = ON")
             self._conn.execute("BEGIN;")
         self._tx_stack.stack.append(self)
         return self._conn.cursor()  # type: ignore
@@ -263,11 +262,50 @@ class SqliteDB(MigratableDB, SqlEmbeddingsQueue, SqlSysDB):
     def vacuum(self, timeout: int = 5) -> None:
         """Runs VACUUM on the database. `timeout` is the maximum time to wait for an exclusive lock in seconds."""
         conn = self._conn_pool.connect()
-        conn.execute(f"PRAGMA busy_timeout = {int(timeout) * 1000}")
-        conn.execute("VACUUM")
-        conn.execute(
-            """
-            INSERT INTO maintenance_log (operation, timestamp)
-            VALUES ('vacuum', CURRENT_TIMESTAMP)
-            """
-        )
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(timeout) * 1000}")
+            conn.execute("VACUUM")
+            conn.execute(
+                """
+                INSERT INTO maintenance_log (operation, timestamp)
+                VALUES ('vacuum', CURRENT_TIMESTAMP)
+                """
+            )
+        finally:
+            # LockPool holds its lock until the connection is returned
+            self._conn_pool.return_to_pool(conn)
+        self.analyze()
+        # VACUUM writes the rebuilt database through the write-ahead log. The vacuum
+        # itself has already committed, so a blocked checkpoint is not an error here.
+        try:
+            self.checkpoint(timeout)
+        except sqlite3.OperationalError as e:
+            logger.warning(
+                f"Vacuum complete, but the write-ahead log was not truncated: {e}"
+            )
+
+    def checkpoint(self, timeout: int = 5) -> None:
+        """Copies the write-ahead log into the database file and truncates the log. `timeout` is the maximum time to wait for other connections in seconds. Raises sqlite3.OperationalError if another connection keeps the checkpoint from completing."""
+        conn = self._conn_pool.connect()
+        try:
+            busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+            conn.execute(f"PRAGMA busy_timeout = {int(timeout) * 1000}")
+            try:
+                busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            finally:
+                conn.execute(f"PRAGMA busy_timeout = {busy_timeout}")
+        finally:
+            self._conn_pool.return_to_pool(conn)
+        if busy:
+            raise sqlite3.OperationalError(
+                "database is locked: could not checkpoint the write-ahead log"
+            )
+
+    def analyze(self) -> None:
+        """Refreshes query planner statistics with ANALYZE. `analysis_limit` bounds how many rows are sampled per index, so this stays cheap on large databases."""
+        conn = self._conn_pool.connect()
+        try:
+            conn.execute("PRAGMA analysis_limit = 1000")
+            conn.execute("ANALYZE")
+        finally:
+            self._conn_pool.return_to_pool(conn)
@@ -1,33 +1,51 @@
 import sqlite3
 import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Set
+from typing import Callable, Optional
 import threading
 from overrides import override
-from typing_extensions import Annotated
 
 
 class Connection:
     """A threadpool connection that returns itself to the pool on close()"""
 
+    # Pools track their connections through weak references
+    __slots__ = ("_pool", "_conn", "_execute", "__weakref__")
+
     _pool: "Pool"
-    _db_file: str
     _conn: sqlite3.Connection
+    _execute: Callable[..., sqlite3.Cursor]
 
-    def __init__(
-        self, pool: "Pool", db_file: str, is_uri: bool, *args: Any, **kwargs: Any
-    ):
+    def __init__(self, pool: "Pool", db_file: str, is_uri: bool):
         self._pool = pool
-        self._db_file = db_file
         self._conn = sqlite3.connect(
-            db_file, timeout=1000, check_same_thread=False, uri=is_uri, *args, **kwargs
-        )  # type: ignore
+            db_file,
+            timeout=1000,
+            check_same_thread=False,
+            uri=is_uri,
+            # Prepared statements are cached per connection and keyed by SQL text. The
+            # default of 128 is smaller than the set of distinct queries we generate.
+            cached_statements=512,
+        )
         self._conn.isolation_level = None  # Handle commits explicitly
+        self._execute = self._conn.execute
+        # page_size only takes effect on a database that is still empty, and must be set
+        # before switching to WAL mode, which fixes the page size. Both are no-ops on a
+        # database that is already in WAL mode.
+        self._conn.executescript(
+            """
+            PRAGMA page_size = 16384;
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA wal_autocheckpoint = 1000;
+            PRAGMA case_sensitive_like = ON;
+            """
+        )
 
     def execute(self, sql: str, parameters=...) -> sqlite3.Cursor:  # type: ignore
         if parameters is ...:
-            return self._conn.execute(sql)
-        return self._conn.execute(sql, parameters)
+            return self._execute(sql)
+        return self._execute(sql, parameters)
 
     def commit(self) -> None:
         self._conn.commit()
@@ -46,12 +64,14 @@ class Connection:
 class Pool(ABC):
     """Abstract base class for a pool of connections to a sqlite database."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, db_file: str, is_uri: bool) -> None:
         pass
 
     @abstractmethod
-    def connect(self, *args: Any, **kwargs: Any) -> Connection:
+    def connect(self) -> Connection:
         """Return a connection from the pool."""
         pass
 
@@ -72,30 +92,31 @@ class LockPool(Pool):
     shared cache mode. We use the shared cache mode to allow multiple threads to share a database.
     """
 
-    _connections: Set[Annotated[weakref.ReferenceType, Connection]]
+    __slots__ = ("_connections", "_lock", "_connection", "_db_file", "_is_uri")
+
+    _connections: "weakref.WeakSet[Connection]"
     _lock: threading.RLock
     _connection: threading.local
     _db_file: str
     _is_uri: bool
 
     def __init__(self, db_file: str, is_uri: bool = False):
-        self._connections = set()
+        self._connections = weakref.WeakSet()
         self._connection = threading.local()
         self._lock = threading.RLock()
         self._db_file = db_file
         self._is_uri = is_uri
 
     @override
-    def connect(self, *args: Any, **kwargs: Any) -> Connection:
+    def connect(self) -> Connection:
         self._lock.acquire()
-        if hasattr(self._connection, "conn") and self._connection.conn is not None:
-            return self._connection.conn  # type: ignore # cast doesn't work here for some reason
+        conn: Optional[Connection] = getattr(self._connection, "conn", None)
+        if conn is not None:
+            return conn
         else:
-            new_connection = Connection(
-                self, self._db_file, self._is_uri, *args, **kwargs
-            )
+            new_connection = Connection(self, self._db_file, self._is_uri)
             self._connection.conn = new_connection
-            self._connections.add(weakref.ref(new_connection))
+            self._connections.add(new_connection)
             return new_connection
 
     @override
@@ -107,9 +128,8 @@ class LockPool(Pool):
 
     @override
     def close(self) -> None:
-        for conn in self._connections:
-            if conn() is not None:
-                conn().close_actual()  # type: ignore
+        for conn in list(self._connections):
+            conn.close_actual()
         self._connections.clear()
         self._connection = threading.local()
         try:
@@ -123,38 +143,38 @@ class PerThreadPool(Pool):
     extended to do so and block on connect() if the cap is reached.
     """
 
-    _connections: Set[Annotated[weakref.ReferenceType, Connection]]
+    __slots__ = ("_connections", "_lock", "_connection", "_db_file", "_is_uri")
+
+    _connections: "weakref.WeakSet[Connection]"
     _lock: threading.Lock
     _connection: threading.local
     _db_file: str
-    _is_uri_: bool
+    _is_uri: bool
 
     def __init__(self, db_file: str, is_uri: bool = False):
-        self._connections = set()
+        self._connections = weakref.WeakSet()
         self._connection = threading.local()
         self._lock = threading.Lock()
         self._db_file = db_file
         self._is_uri = is_uri
 
     @override
-    def connect(self, *args: Any, **kwargs: Any) -> Connection:
-        if hasattr(self._connection, "conn") and self._connection.conn is not None:
-            return self._connection.conn  # type: ignore # cast doesn't work here for some reason
+    def connect(self) -> Connection:
+        conn: Optional[Connection] = getattr(self._connection, "conn", None)
+        if conn is not None:
+            return conn
         else:
-            new_connection = Connection(
-                self, self._db_file, self._is_uri, *args, **kwargs
-            )
+            new_connection = Connection(self, self._db_file, self._is_uri)
             self._connection.conn = new_connection
             with self._lock:
-                self._connections.add(weakref.ref(new_connection))
+                self._connections.add(new_connection)
             return new_connection
 
     @override
     def close(self) -> None:
         with self._lock:
-            for conn in self._connections:
-                if conn() is not None:
-                    conn().close_actual()  # type: ignore
+            for conn in list(self._connections):
+                conn.close_actual()
             self._connections.clear()
             self._connection = threading.local()
 
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import threading
+
+from chromadb.config import Settings, System
+from chromadb.db.impl.sqlite import SqliteDB
+from chromadb.db.impl.sqlite_pool import LockPool, PerThreadPool
+
+
+def test_new_databases_use_wal_and_16kib_pages() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_file = f"{tmpdir}/chroma.sqlite3"
+        # Recreating the database at the same path should set it up from scratch
+        for _ in range(2):
+            pool = PerThreadPool(db_file)
+            conn = pool.connect()
+            conn.execute("CREATE TABLE IF NOT EXISTS t (a)")
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA page_size").fetchone()[0] == 16384
+            pool.close()
+            os.remove(db_file)
+
+    for _ in range(2):
+        lock_pool = LockPool(
+            "file:page_size_test?mode=memory&cache=shared", is_uri=True
+        )
+        conn = lock_pool.connect()
+        assert conn.execute("PRAGMA page_size").fetchone()[0] == 16384
+        lock_pool.return_to_pool(conn)
+        lock_pool.close()
+
+
+def vacuum_and_acquire_lock_from_another_thread() -> None:
+    system = System(Settings(is_persistent=False, allow_reset=True))
+    system.start()
+    sqlite_db = system.instance(SqliteDB)
+    sqlite_db.vacuum()
+
+    acquired = []
+
+    def acquire_lock() -> None:
+        lock = sqlite_db._conn_pool._lock  # type: ignore[attr-defined]
+        acquired.append(lock.acquire(timeout=5))
+        if acquired[0]:
+            lock.release()
+
+    thread = threading.Thread(target=acquire_lock)
+    thread.start()
+    thread.join()
+    assert acquired == [True]
+    system.stop()
+
+
+def test_vacuum_returns_connection_to_pool() -> None:
+    """Vacuuming an in-memory database should not leave the pool locked for other threads."""
+    # VACUUM rewrites the process-wide shared in-memory database underneath any other
+    # connections that are still open to it, which breaks it for later tests. Run the
+    # scenario in its own process instead.
+    ctx = multiprocessing.get_context("spawn")
+    process = ctx.Process(target=vacuum_and_acquire_lock_from_another_thread)
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+def test_vacuum_succeeds_while_checkpoint_is_blocked(
+    sqlite_persistent: System,
+) -> None:
+    sqlite_db = sqlite_persistent.instance(SqliteDB)
+    db_file = f"{sqlite_persistent.settings.persist_directory}/chroma.sqlite3"
+
+    # An open read snapshot keeps the write-ahead log from being truncated
+    reader = sqlite3.connect(db_file, isolation_level=None)
+    try:
+        reader.execute("BEGIN")
+        reader.execute("SELECT * FROM maintenance_log").fetchall()
+
+        sqlite_db.vacuum(timeout=1)
+    finally:
+        reader.close()
+
+    with sqlite_db.tx() as cur:
+        cur.execute("SELECT operation FROM maintenance_log")
+        assert cur.fetchall() == [("vacuum",)]
+
+
+def test_vacuum_refreshes_planner_statistics(sqlite_persistent: System) -> None:
+    sqlite_db = sqlite_persistent.instance(SqliteDB)
+    # ANALYZE only records statistics for tables that have rows
+    with sqlite_db.tx() as cur:
+        cur.execute(
+            """
+            INSERT INTO embeddings (id, segment_id, embedding_id, seq_id)
+            VALUES (1, 'segment', 'embedding', 1)
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO embedding_metadata (id, key, string_value)
+            VALUES (1, 'key', 'value')
+            """
+        )
+    sqlite_db.vacuum()
+
+    with sqlite_db.tx() as cur:
+        cur.execute("SELECT DISTINCT tbl FROM sqlite_stat1")
+        analyzed_tables = {row[0] for row in cur.fetchall()}
+    assert "embeddings" in analyzed_tables
+    assert "embedding_metadata" in analyzed_tables
@@ -14,7 +14,7 @@ from hypothesis.stateful import (
     run_state_machine_as_test,
     MultipleResults,
 )
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 import numpy
 from chromadb.test.property.strategies import hashing_embedding_function
 
@@ -35,10 +35,10 @@ class CollectionStateMachine(RuleBasedStateMachine):
         self.client.reset()
         self._model = {}
 
-    @rule(target=collections, coll=strategies.collections())
-    def create_coll(
+    def _create_coll(
         self, coll: strategies.ExternalCollection
-    ) -> MultipleResults[strategies.ExternalCollection]:
+    ) -> Optional[strategies.ExternalCollection]:
+        """Creates `coll`, returning it if it was created and None if creation was expected to fail."""
         # Metadata can either be None or a non-empty dict
         if coll.name in self.model or (
             coll.metadata is not None and len(coll.metadata) == 0
@@ -49,7 +49,7 @@ class CollectionStateMachine(RuleBasedStateMachine):
                     metadata=coll.metadata,  # type: ignore[arg-type]
                     embedding_function=coll.embedding_function,
                 )
-            return multiple()
+            return None
 
         c = self.client.create_collection(
             name=coll.name,
@@ -60,7 +60,26 @@ class CollectionStateMachine(RuleBasedStateMachine):
 
         assert c.name == coll.name
         assert c.metadata == self.model[coll.name]
-        return multiple(coll)
+        return coll
+
+    @rule(target=collections, coll=strategies.collections())
+    def create_coll(
+        self, coll: strategies.ExternalCollection
+    ) -> MultipleResults[strategies.ExternalCollection]:
+        created = self._create_coll(coll)
+        return multiple() if created is None else multiple(created)
+
+    # Creating several collections in one step lets Hypothesis reach states with
+    # many collections in fewer steps, which keeps both generation and shrinking short.
+    @rule(
+        target=collections,
+        colls=st.lists(strategies.collections(), min_size=2, max_size=8),
+    )
+    def create_colls(
+        self, colls: List[strategies.ExternalCollection]
+    ) -> MultipleResults[strategies.ExternalCollection]:
+        created = [self._create_coll(coll) for coll in colls]
+        return multiple(*[coll for coll in created if coll is not None])
 
     @rule(coll=collections)
     def get_coll(self, coll: strategies.ExternalCollection) -> None:
@@ -5,7 +5,7 @@ from multiprocessing.synchronize import Event
 from typer.testing import CliRunner
 
 from chromadb.cli.cli import app
-from chromadb.cli.utils import set_log_file_path
+from chromadb.cli.utils import get_file_size, set_log_file_path
 from chromadb.config import Settings, System
 from chromadb.db.base import get_sql
 from chromadb.db.impl.sqlite import SqliteDB
@@ -30,6 +30,14 @@ def test_app() -> None:
     assert "8001" in result.stdout
 
 
+def test_app_rejects_unknown_event_loop() -> None:
+    result = runner.invoke(
+        app,
+        ["run", "--path", "chroma_test_data", "--loop", "uvlop", "--test"],
+    )
+    assert result.exit_code != 0
+
+
 def test_utils_set_log_file_path() -> None:
     log_config = set_log_file_path("chromadb/log_config.yml", "test.log")
     assert log_config["handlers"]["file"]["filename"] == "test.log"
@@ -73,6 +81,31 @@ def test_vacuum(sqlite_persistent: System) -> None:
     assert sqlite.config.get_parameter("automatically_purge").value
 
 
+def test_vacuum_checkpoint_only(sqlite_persistent: System) -> None:
+    system = sqlite_persistent
+    sqlite = system.instance(SqliteDB)
+    wal_path = f"{system.settings.persist_directory}/chroma.sqlite3-wal"
+
+    result = runner.invoke(
+        app,
+        [
+            "utils",
+            "vacuum",
+            "--path",
+            system.settings.persist_directory,
+            "--checkpoint-only",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "checkpoint complete" in result.stdout
+    assert get_file_size(wal_path) == 0
+
+    # Only the log is checkpointed, so no vacuum should have been recorded
+    with sqlite.tx() as cur:
+        cur.execute("SELECT * FROM maintenance_log")
+        assert cur.fetchall() == []
+
+
 def simulate_transactional_write(
     settings: Settings, ready_event: Event, shutdown_event: Event
 ) -> None: